@@ -1,11 +1,20 @@
+import functools
+import hashlib
 import json
 import os
 import math
+import shutil
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
+import numpy as np
+import orjson
 import requests
 from colorama import Fore, Style, init
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 init(autoreset=True)
 
@@ -13,12 +22,101 @@ init(autoreset=True)
 # --------------------
 # HELPERS
 # --------------------
-def ua():
-    """NOAA requires a custom user agent."""
-    return {"User-Agent": "(myweatherapp, email@example.com)"}
+# NOAA requires a custom user agent. One pooled session keeps TCP/TLS
+# connections alive across the several api.weather.gov calls per run.
+UA_HEADERS = {"User-Agent": "(myweatherapp, email@example.com)"}
+
+SESSION = requests.Session()
+SESSION.headers.update(UA_HEADERS)
+# Ask for compressed bodies explicitly; the hourly forecast JSON easily
+# tops 100KB uncompressed.
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+        ),
+    ),
+)
+
+# On-disk TTL cache for JSON GETs, matched to how often NOAA actually
+# updates each product: hourly forecasts roughly hourly, daily forecasts
+# a few times a day, alerts on event timescales.
+CACHE_DIR = ".wxcache"
+HOURLY_TTL = 30 * 60
+DAILY_TTL = 3 * 3600
+ALERTS_TTL = 5 * 60
+
+
+def _json(resp):
+    """Parse a response body with orjson (noticeably faster than stdlib
+    json on the larger NOAA payloads)."""
+    return orjson.loads(resp.content)
+
+
+def cached_get_json(url, ttl):
+    """GET a JSON URL through an on-disk cache with TTL and revalidation.
+
+    Entries younger than ttl seconds are served without touching the
+    network. Stale entries are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged NOAA body costs a 304 with only
+    headers on the wire instead of the full payload.
+    """
+    key = hashlib.md5(url.encode()).hexdigest()
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    entry = None
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        if entry and time.time() - os.path.getmtime(path) < ttl:
+            return entry["body"]
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    resp = SESSION.get(url, headers=headers, timeout=10)
+    if resp.status_code == 304 and entry:
+        os.utime(path)  # body unchanged; restart the TTL window
+        return entry["body"]
+    resp.raise_for_status()
+    body = _json(resp)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    entry = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "body": body,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    return body
+
+
+def print_section(lines):
+    """Emit pre-colored lines as one stdout write instead of per-line
+    print calls, so colorama parses and the terminal receives a whole
+    section at a time. Each line gets its own reset since autoreset only
+    fires per write."""
+    sys.stdout.write(
+        "".join(line + Style.RESET_ALL + "\n" for line in lines)
+    )
+    sys.stdout.flush()
 
 
+@functools.lru_cache(maxsize=64)
 def condition_color(cond):
+    # Forecast periods repeat a handful of condition strings, so each
+    # distinct one pays for the substring scans only once.
     cond_lower = cond.lower()
     if "rain" in cond_lower:
         return Fore.CYAN
@@ -31,109 +129,206 @@ def condition_color(cond):
     return Fore.GREEN
 
 
+PHASES = (
+    "New Moon",
+    "Waxing Crescent",
+    "First Quarter",
+    "Waxing Gibbous",
+    "Full Moon",
+    "Waning Gibbous",
+    "Last Quarter",
+    "Waning Crescent",
+)
+
+
 def moon_phase(date):
-    """Return moon phase name for a given date."""
-    year, month, day = date.year, date.month, date.day
-    c = e = jd = b = 0
-    if month < 3:
-        year -= 1
-        month += 12
-    month += 1
-    c = 365.25 * year
-    e = 30.6 * month
-    jd = c + e + day - 694039.09  # JD base
-    jd /= 29.53
-    b = int(jd)
-    jd -= b
-    phase_index = round(jd * 8)
-    if phase_index >= 8:
-        phase_index = 0
-    phases = [
-        "New Moon",
-        "Waxing Crescent",
-        "First Quarter",
-        "Waxing Gibbous",
-        "Full Moon",
-        "Waning Gibbous",
-        "Last Quarter",
-        "Waning Crescent",
-    ]
-    return phases[phase_index]
+    """Return moon phase name for a given datetime.
+
+    Fraction of lunations elapsed since the reference new moon of
+    2000-01-06 (JD 2451550.1), mapped onto the eight named phases.
+    """
+    jd = date.toordinal() + 1721424.5 + (date.hour + date.minute / 60) / 24
+    k = (jd - 2451550.1) / 29.53058867  # mean synodic month in days
+    return PHASES[int((k - math.floor(k)) * 8 + 0.5) % 8]
 
 
 # --------------------
 # LOCATION
 # --------------------
+LOCATION_CACHE_FILE = os.path.expanduser("~/.cache/weatherapp/location.json")
+LOCATION_TTL = 7 * 86400  # IP geolocation drifts on week timescales
+
+
+@functools.lru_cache(maxsize=1)
 def get_location():
+    # LAT/LON env vars short-circuit the ipinfo.io round trip entirely;
+    # one os.environ reference covers all four lookups. The lru_cache
+    # keeps repeat calls in the same process off the network too.
+    env = os.environ
+    lat, lon = env.get("LAT"), env.get("LON")
+    if lat and lon:
+        return float(lat), float(lon), env.get("CITY"), env.get("REGION")
+    if (
+        os.path.exists(LOCATION_CACHE_FILE)
+        and time.time() - os.path.getmtime(LOCATION_CACHE_FILE) < LOCATION_TTL
+    ):
+        try:
+            with open(LOCATION_CACHE_FILE, "r", encoding="utf-8") as f:
+                d = json.load(f)
+            return d["lat"], d["lon"], d["city"], d["region"]
+        except (OSError, ValueError, KeyError):
+            pass
     try:
-        resp = requests.get("https://ipinfo.io/json", timeout=5)
+        resp = SESSION.get("https://ipinfo.io/json", timeout=5)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json(resp)
         loc = data["loc"].split(",")
         latitude, longitude = map(float, loc)
-        return latitude, longitude, data.get("city"), data.get("region")
+        city, region = data.get("city"), data.get("region")
     except Exception as e:
         raise RuntimeError(f"Error detecting location: {e}")
+    os.makedirs(os.path.dirname(LOCATION_CACHE_FILE), exist_ok=True)
+    with open(LOCATION_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {"lat": latitude, "lon": longitude, "city": city,
+             "region": region},
+            f,
+        )
+    return latitude, longitude, city, region
 
 
 # --------------------
-# CURRENT WEATHER
+# POINTS METADATA
 # --------------------
-def get_current_weather(lat, lon):
-    try:
-        points_url = f"https://api.weather.gov/points/{lat},{lon}"
-        points_resp = requests.get(points_url, headers=ua(), timeout=10)
-        points_resp.raise_for_status()
-        station_url = points_resp.json()["properties"]["observationStations"]
-        stations_resp = requests.get(station_url, headers=ua(), timeout=10)
-        stations_resp.raise_for_status()
-        stations = stations_resp.json()["features"]
-        if not stations:
-            raise RuntimeError(
-                "No observation stations found for this location."
-            )
-        station_id = stations[0]["properties"]["stationIdentifier"]
-
-        obs_url = (
-            "https://api.weather.gov/stations/"
-            f"{station_id}/observations/latest"
+POINTS_CACHE_FILE = "points_cache.json"
+POINTS_TTL = 24 * 3600  # NOAA grid metadata is effectively static
+STATION_TTL = 7 * 86400  # nearest station never moves for a fixed point
+
+
+def _read_points_cache():
+    if os.path.exists(POINTS_CACHE_FILE):
+        try:
+            with open(POINTS_CACHE_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def _write_points_cache(cache):
+    with open(POINTS_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+@functools.lru_cache(maxsize=8)
+def get_points(lat, lon):
+    """Resolve `/points` properties for a location, caching on disk.
+
+    Current conditions and forecasts both need this lookup; caching it
+    saves a round trip per run and skips the network entirely while the
+    cache entry is fresh.
+    """
+    key = f"{lat:.4f},{lon:.4f}"  # NOAA snaps points to a 4-decimal grid
+    cache = _read_points_cache()
+    entry = cache.get(key, {})
+    if "data" in entry and time.time() - entry["ts"] < POINTS_TTL:
+        return entry["data"]
+    resp = SESSION.get(f"https://api.weather.gov/points/{key}", timeout=10)
+    resp.raise_for_status()
+    properties = _json(resp)["properties"]
+    entry.update(ts=time.time(), data=properties)
+    cache[key] = entry
+    _write_points_cache(cache)
+    return properties
+
+
+@functools.lru_cache(maxsize=8)
+def get_station_id(lat, lon):
+    """Find the nearest observation station, caching the resolved id.
+
+    The station list is a second round trip on top of `/points`, and the
+    answer never changes for a fixed location, so keep it in the points
+    cache for a week and skip both lookups on warm runs.
+    """
+    key = f"{lat:.4f},{lon:.4f}"
+    cache = _read_points_cache()
+    entry = cache.get(key, {})
+    if (
+        "station_id" in entry
+        and time.time() - entry.get("station_ts", 0) < STATION_TTL
+    ):
+        return entry["station_id"]
+    station_url = get_points(lat, lon)["observationStations"]
+    stations_resp = SESSION.get(station_url, timeout=10)
+    stations_resp.raise_for_status()
+    stations = _json(stations_resp)["features"]
+    if not stations:
+        raise RuntimeError(
+            "No observation stations found for this location."
         )
-        obs_resp = requests.get(obs_url, headers=ua(), timeout=10)
-        obs_resp.raise_for_status()
-        data = obs_resp.json()["properties"]
-
-        desc = data.get("textDescription", "N/A")
-        temp_c = data["temperature"]["value"]
-        temp_f = temp_c * 9 / 5 + 32 if temp_c is not None else None
-        humidity = data["relativeHumidity"]["value"]
-        wind_speed = data["windSpeed"]["value"]
-        wind_speed_mph = wind_speed * 2.237 if wind_speed is not None else None
-        sunrise, sunset = get_sun_times(lat, lon)
-
-        print(Fore.CYAN + Style.BRIGHT + "\n=== Current Conditions ===")
-        print(Fore.YELLOW + f"Condition: {desc}")
-        if temp_c is not None:
-            color = (
-                Fore.RED
-                if temp_f > 85
-                else Fore.BLUE
-                if temp_f < 50
-                else Fore.GREEN
-            )
-            print(color + f"Temperature: {temp_c:.1f}°C / {temp_f:.1f}°F")
-        if humidity is not None:
-            print(Fore.BLUE + f"Humidity: {humidity:.1f}%")
-        if wind_speed is not None:
-            print(Fore.MAGENTA + f"Wind Speed: {wind_speed_mph:.1f} mph")
-        print(Fore.LIGHTYELLOW_EX + f"Sunrise: {sunrise} | Sunset: {sunset}")
-        print(
-            Fore.LIGHTWHITE_EX
-            + f"Moon Phase: {moon_phase(datetime.utcnow())}"
+    station_id = stations[0]["properties"]["stationIdentifier"]
+    cache = _read_points_cache()  # get_points may have written meanwhile
+    entry = cache.setdefault(key, {})
+    entry.update(station_id=station_id, station_ts=time.time())
+    _write_points_cache(cache)
+    return station_id
+
+
+# --------------------
+# CURRENT WEATHER
+# --------------------
+def fetch_current(lat, lon):
+    station_id = get_station_id(lat, lon)
+    obs_url = (
+        "https://api.weather.gov/stations/"
+        f"{station_id}/observations/latest"
+    )
+    obs_resp = SESSION.get(obs_url, timeout=10)
+    obs_resp.raise_for_status()
+    return _json(obs_resp)["properties"]
+
+
+def _v(data, key):
+    """Pull the nested "value" out of an observation field, tolerating
+    fields NOAA omits entirely on sparse observations."""
+    field = data.get(key)
+    return field.get("value") if field else None
+
+
+def render_current(data, sun_times):
+    sunrise, sunset = sun_times
+    desc = data.get("textDescription", "N/A")
+    temp_c = _v(data, "temperature")
+    temp_f = temp_c * 9 / 5 + 32 if temp_c is not None else None
+    humidity = _v(data, "relativeHumidity")
+    wind_speed = _v(data, "windSpeed")
+    wind_speed_mph = wind_speed * 2.237 if wind_speed is not None else None
+
+    lines = [
+        Fore.CYAN + Style.BRIGHT + "\n=== Current Conditions ===",
+        Fore.YELLOW + f"Condition: {desc}",
+    ]
+    if temp_c is not None:
+        color = (
+            Fore.RED
+            if temp_f > 85
+            else Fore.BLUE
+            if temp_f < 50
+            else Fore.GREEN
         )
-    except requests.HTTPError as e:
-        print(Fore.RED + f"HTTP error fetching current weather: {e}")
-    except Exception as e:
-        print(Fore.RED + f"Error fetching current weather: {e}")
+        lines.append(color + f"Temperature: {temp_c:.1f}°C / {temp_f:.1f}°F")
+    if humidity is not None:
+        lines.append(Fore.BLUE + f"Humidity: {humidity:.1f}%")
+    if wind_speed is not None:
+        lines.append(Fore.MAGENTA + f"Wind Speed: {wind_speed_mph:.1f} mph")
+    lines.append(
+        Fore.LIGHTYELLOW_EX + f"Sunrise: {sunrise} | Sunset: {sunset}"
+    )
+    lines.append(
+        Fore.LIGHTWHITE_EX
+        + f"Moon Phase: {moon_phase(datetime.now(timezone.utc))}"
+    )
+    print_section(lines)
 
 
 # --------------------
@@ -145,9 +340,9 @@ def get_sun_times(lat, lon):
             "https://api.sunrise-sunset.org/json"
             f"?lat={lat}&lng={lon}&formatted=0"
         )
-        resp = requests.get(url, timeout=5)
+        resp = SESSION.get(url, timeout=5)
         resp.raise_for_status()
-        data = resp.json()["results"]
+        data = _json(resp)["results"]
         sunrise = datetime.fromisoformat(data["sunrise"]).strftime("%I:%M %p")
         sunset = datetime.fromisoformat(data["sunset"]).strftime("%I:%M %p")
         return sunrise, sunset
@@ -159,145 +354,154 @@ def get_sun_times(lat, lon):
 # --------------------
 # FORECAST
 # --------------------
-def get_forecasts(lat, lon):
-    try:
-        points_url = f"https://api.weather.gov/points/{lat},{lon}"
-        points_resp = requests.get(points_url, headers=ua(), timeout=10)
-        points_resp.raise_for_status()
-        properties = points_resp.json()["properties"]
-
-        hourly_url = properties["forecastHourly"]
-        hourly_resp = requests.get(hourly_url, headers=ua(), timeout=10)
-        hourly_resp.raise_for_status()
-        hourly_periods = hourly_resp.json()["properties"]["periods"]
-
-        print(Fore.CYAN + Style.BRIGHT + "\n=== Next 12 Hours ===")
-        for hour in hourly_periods[:12]:
-            t = datetime.fromisoformat(
-                hour["startTime"]
-            ).astimezone().strftime("%I %p")
-            temp = f"{hour['temperature']}°{hour['temperatureUnit']}"
-            cond = hour["shortForecast"]
-            color = condition_color(cond)
-            print(f"{t:>6} | {color}{temp:<6} | {cond}")
-
-        daily_url = properties["forecast"]
-        daily_resp = requests.get(daily_url, headers=ua(), timeout=10)
-        daily_resp.raise_for_status()
-        daily_periods = daily_resp.json()["properties"]["periods"]
-
-        print(Fore.CYAN + Style.BRIGHT + "\n=== 7-Day Forecast ===")
-        for day in daily_periods:
-            temp = f"{day['temperature']}°{day['temperatureUnit']}"
-            cond = day["shortForecast"]
-            color = condition_color(cond)
-            print(f"{day['name']:<12} | {color}{temp:<6} | {cond}")
+def fetch_forecasts(properties):
+    hourly = cached_get_json(properties["forecastHourly"], HOURLY_TTL)
+    hourly_periods = hourly["properties"]["periods"]
 
-    except requests.HTTPError as e:
-        print(Fore.RED + f"HTTP error fetching forecasts: {e}")
-    except Exception as e:
-        print(Fore.RED + f"Error fetching forecasts: {e}")
+    daily = cached_get_json(properties["forecast"], DAILY_TTL)
+    daily_periods = daily["properties"]["periods"]
+
+    return hourly_periods, daily_periods
+
+
+def render_forecasts(forecasts):
+    hourly_periods, daily_periods = forecasts
+
+    lines = [Fore.CYAN + Style.BRIGHT + "\n=== Next 12 Hours ==="]
+    for hour in hourly_periods[:12]:
+        # startTime is fixed-format ISO with the forecast zone's own
+        # offset (e.g. 2024-01-15T14:00:00-05:00), so the hour digits can
+        # be sliced out directly instead of building a datetime per row.
+        h = int(hour["startTime"][11:13])
+        t = f"{(h - 1) % 12 + 1:02d} {'PM' if h >= 12 else 'AM'}"
+        temp = f"{hour['temperature']}°{hour['temperatureUnit']}"
+        cond = hour["shortForecast"]
+        color = condition_color(cond)
+        lines.append(f"{t:>6} | {color}{temp:<6} | {cond}")
+
+    lines.append(Fore.CYAN + Style.BRIGHT + "\n=== 7-Day Forecast ===")
+    for day in daily_periods:
+        temp = f"{day['temperature']}°{day['temperatureUnit']}"
+        cond = day["shortForecast"]
+        color = condition_color(cond)
+        lines.append(f"{day['name']:<12} | {color}{temp:<6} | {cond}")
+    print_section(lines)
 
 
 # --------------------
 # ALERTS
 # --------------------
-def get_alerts(lat, lon):
-    try:
-        alerts_url = f"https://api.weather.gov/alerts/active?point={lat},{lon}"
-        resp = requests.get(alerts_url, headers=ua(), timeout=10)
-        resp.raise_for_status()
-        alerts = resp.json()["features"]
-
-        print(Fore.CYAN + Style.BRIGHT + "\n=== Active Alerts ===")
-        if not alerts:
-            print(Fore.GREEN + "No active alerts.")
-            return
-
-        for alert in alerts:
-            props = alert["properties"]
-            print(Fore.RED + Style.BRIGHT + f"{props['event']}")
-            print(Fore.LIGHTWHITE_EX + f"  {props['headline']}")
-            print(Fore.YELLOW + f"  {props['description']}\n")
-    except Exception as e:
-        print(Fore.RED + f"Error fetching alerts: {e}")
+def fetch_alerts(lat, lon):
+    alerts_url = f"https://api.weather.gov/alerts/active?point={lat},{lon}"
+    return cached_get_json(alerts_url, ALERTS_TTL)["features"]
+
+
+def render_alerts(alerts):
+    lines = [Fore.CYAN + Style.BRIGHT + "\n=== Active Alerts ==="]
+    if not alerts:
+        lines.append(Fore.GREEN + "No active alerts.")
+    for alert in alerts:
+        props = alert["properties"]
+        lines.append(Fore.RED + Style.BRIGHT + f"{props['event']}")
+        lines.append(Fore.LIGHTWHITE_EX + f"  {props['headline']}")
+        lines.append(Fore.YELLOW + f"  {props['description']}\n")
+    print_section(lines)
 
 
 # --------------------
 # RADAR
 # --------------------
-RADAR_CACHE_FILE = "radar_stations.json"
-
-
-def haversine(lat1, lon1, lat2, lon2):
-    radius = 6371  # km
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = (
-        math.sin(dphi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+RADAR_CACHE_FILE = "radar_stations.npz"
+
+
+def haversine_a(lat, lon, lat_rad, lon_rad):
+    """Haversine comparison term against stations in radians.
+
+    This is the "a" from the haversine formula; the full distance is
+    2*R*atan2(sqrt(a), sqrt(1-a)), but atan2 and sqrt are monotonic on
+    a in [0, 1], so ranking by "a" alone gives the same nearest pick.
+    """
+    dphi = lat_rad - math.radians(lat)
+    dlambda = lon_rad - math.radians(lon)
+    return (
+        np.sin(dphi / 2) ** 2
+        + math.cos(math.radians(lat))
+        * np.cos(lat_rad)
+        * np.sin(dlambda / 2) ** 2
     )
-    return 2 * radius * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+@functools.lru_cache(maxsize=1)
 def load_radar_stations():
+    """Return (ids, lat_rad, lon_rad) arrays for all NEXRAD stations.
+
+    Cached on disk as an .npz in the same structure-of-arrays layout the
+    vectorized haversine consumes, so warm loads skip both the ~1MB
+    GeoJSON download and the per-station dict rebuild.
+    """
     if os.path.exists(RADAR_CACHE_FILE):
-        with open(RADAR_CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        data = np.load(RADAR_CACHE_FILE)
+        return data["ids"], data["lat"], data["lon"]
     url = "https://api.weather.gov/radar/stations"
-    resp = requests.get(url, headers=ua(), timeout=10)
+    resp = SESSION.get(url, timeout=10)
     resp.raise_for_status()
-    stations = [
-        {
-            "id": s["properties"]["id"],
-            "lat": s["geometry"]["coordinates"][1],
-            "lon": s["geometry"]["coordinates"][0],
-        }
-        for s in resp.json()["features"]
-    ]
-    with open(RADAR_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(stations, f)
-    return stations
+    features = _json(resp)["features"]
+    ids = np.array([s["properties"]["id"] for s in features])
+    lat_rad = np.radians([s["geometry"]["coordinates"][1] for s in features])
+    lon_rad = np.radians([s["geometry"]["coordinates"][0] for s in features])
+    np.savez(RADAR_CACHE_FILE, ids=ids, lat=lat_rad, lon=lon_rad)
+    return ids, lat_rad, lon_rad
 
 
 def get_nearest_radar(lat, lon):
-    try:
-        stations = load_radar_stations()
-    except requests.RequestException as e:
-        print(Fore.RED + f"Error fetching radar stations: {e}")
-        return None
-    return min(
-        stations,
-        key=lambda s: haversine(lat, lon, s["lat"], s["lon"]),
-    )["id"]
+    ids, lat_rad, lon_rad = load_radar_stations()
+    # The nearest NEXRAD site is within a few degrees for any point in
+    # coverage, so trim to a 5-degree box before the trig; fall back to
+    # the full scan if nothing lands inside (sparse-coverage edge cases).
+    box = math.radians(5.0)
+    mask = (np.abs(lat_rad - math.radians(lat)) < box) & (
+        np.abs(lon_rad - math.radians(lon)) < box
+    )
+    if mask.any():
+        ids, lat_rad, lon_rad = ids[mask], lat_rad[mask], lon_rad[mask]
+    a = haversine_a(lat, lon, lat_rad, lon_rad)
+    return str(ids[int(np.argmin(a))])
+
+
+def fetch_radar_image(lat, lon):
+    radar_id = get_nearest_radar(lat, lon)
+    if not radar_id:
+        raise RuntimeError("Radar station not found.")
+    url = f"https://radar.weather.gov/ridge/lite/N0R/{radar_id}_loop.gif"
+    with SESSION.get(url, stream=True, timeout=10) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        with open("radar.gif", "wb") as f:
+            shutil.copyfileobj(r.raw, f, length=1 << 20)
+    return radar_id
+
+
+def render_radar(radar_id):
+    print(
+        Fore.LIGHTGREEN_EX
+        + f"Radar loop saved as radar.gif (station {radar_id})"
+    )
 
 
-def get_radar_image(lat, lon):
+# --------------------
+# MAIN
+# --------------------
+def resolve(future, what):
+    """Unwrap a fetch future, printing a repo-style error on failure."""
     try:
-        radar_id = get_nearest_radar(lat, lon)
-        if not radar_id:
-            print(Fore.RED + "Radar station not found.")
-            return
-        url = f"https://radar.weather.gov/ridge/lite/N0R/{radar_id}_loop.gif"
-        with requests.get(url, headers=ua(), stream=True, timeout=10) as r:
-            r.raise_for_status()
-            with open("radar.gif", "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-        print(
-            Fore.LIGHTGREEN_EX
-            + f"Radar loop saved as radar.gif (station {radar_id})"
-        )
+        return future.result()
     except requests.HTTPError as e:
-        print(Fore.RED + f"HTTP error fetching radar: {e}")
+        print(Fore.RED + f"HTTP error fetching {what}: {e}")
     except Exception as e:
-        print(Fore.RED + f"Error fetching radar: {e}")
+        print(Fore.RED + f"Error fetching {what}: {e}")
+    return None
 
 
-# --------------------
-# MAIN
-# --------------------
 if __name__ == "__main__":
     try:
         lat, lon, city, region = get_location()
@@ -309,7 +513,32 @@ if __name__ == "__main__":
         + Style.BRIGHT
         + f"Location detected: {city}, {region} ({lat}, {lon})"
     )
-    get_current_weather(lat, lon)
-    get_forecasts(lat, lon)
-    get_alerts(lat, lon)
-    get_radar_image(lat, lon)
+    # The NOAA fetches are independent, so run them concurrently and
+    # render in the original order once everything has resolved. The
+    # /points metadata is resolved exactly once and shared by the
+    # current-conditions and forecast fetches.
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        f_points = ex.submit(get_points, lat, lon)
+        f_sun = ex.submit(get_sun_times, lat, lon)
+        f_alerts = ex.submit(fetch_alerts, lat, lon)
+        f_radar = ex.submit(fetch_radar_image, lat, lon)
+        f_current = f_forecasts = None
+        properties = resolve(f_points, "location metadata")
+        if properties is not None:
+            f_current = ex.submit(fetch_current, lat, lon)
+            f_forecasts = ex.submit(fetch_forecasts, properties)
+
+    if f_current is not None:
+        current = resolve(f_current, "current weather")
+        if current is not None:
+            render_current(current, f_sun.result())
+    if f_forecasts is not None:
+        forecasts = resolve(f_forecasts, "forecasts")
+        if forecasts is not None:
+            render_forecasts(forecasts)
+    alerts = resolve(f_alerts, "alerts")
+    if alerts is not None:
+        render_alerts(alerts)
+    radar_id = resolve(f_radar, "radar")
+    if radar_id is not None:
+        render_radar(radar_id)